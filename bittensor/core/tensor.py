@@ -15,32 +15,44 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import base64
-from typing import Optional, Union
+import functools
+import math
+import re
+import struct
+import threading
+from pickle import PickleBuffer
+from typing import Iterator, Optional, Union
 
 import msgpack
 import msgpack_numpy
 import numpy as np
-from pydantic import ConfigDict, BaseModel, Field, field_validator
+from pydantic import ConfigDict, BaseModel, Field, field_serializer, field_validator
 
 from bittensor.utils.registration import torch, use_torch
 
+try:
+    # SIMD accelerated drop-in replacement for the standard library module, used when installed.
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 
 class DTypes(dict):
+    # numpy entries are prebuilt ``np.dtype`` objects, so casts do not parse the type again on every call.
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.torch: bool = False
         self.update(
             {
-                "float16": np.float16,
-                "float32": np.float32,
-                "float64": np.float64,
-                "uint8": np.uint8,
-                "int16": np.int16,
-                "int8": np.int8,
-                "int32": np.int32,
-                "int64": np.int64,
-                "bool": bool,
+                "float16": np.dtype(np.float16),
+                "float32": np.dtype(np.float32),
+                "float64": np.dtype(np.float64),
+                "uint8": np.dtype(np.uint8),
+                "int16": np.dtype(np.int16),
+                "int8": np.dtype(np.int8),
+                "int32": np.dtype(np.int32),
+                "int64": np.dtype(np.int64),
+                "bool": np.dtype(bool),
             }
         )
 
@@ -71,6 +83,58 @@ class DTypes(dict):
 
 dtypes = DTypes()
 
+# Names of the numpy dtypes in :data:`dtypes`, formatting a dtype with str() is comparatively slow.
+_NUMPY_DTYPE_NAMES = {
+    dtype: name for name, dtype in dict.items(dtypes) if not name.startswith("torch.")
+}
+
+# Version byte leading the header produced by :func:`Tensor.serialize_frames`.
+FRAMES_VERSION = 1
+
+# First byte of the raw buffers packed by ``Tensor.serialize(raw=True)``. msgpack never emits 0xc1, which keeps raw
+# buffers apart from the msgpack buffers of earlier versions.
+RAW_MAGIC = 0xC1
+RAW_VERSION = 1
+
+# Version byte leading the buffers produced by :func:`Tensor.serialize_many`.
+MANY_VERSION = 1
+
+# Header of :func:`Tensor.serialize_many` buffers: version, array count and offset of the data region. It is
+# followed by one entry per array (see :func:`_many_entry`), all sized in multiples of 8 bytes.
+_MANY_HEADER = struct.Struct("<B3xIQ")
+
+# Raw buffer header: magic, version, dtype code and number of dimensions, followed by an int64 per dimension.
+_RAW_HEADER = struct.Struct("<BBBB")
+
+# Codes of the little endian dtypes the raw layout carries.
+_DTYPE_CODES = {
+    np.dtype(type_).newbyteorder("<"): code
+    for code, type_ in enumerate(
+        (
+            np.float16,
+            np.float32,
+            np.float64,
+            np.uint8,
+            np.int16,
+            np.int8,
+            np.int32,
+            np.int64,
+            bool,
+        ),
+        start=1,
+    )
+}
+_CODE_DTYPES = {code: dtype for dtype, code in _DTYPE_CODES.items()}
+
+# Codes of the quantized float payloads written by :func:`Tensor.serialize_quantized`: int8 values with a float64
+# scale following the shape, and bfloat16 values stored as the upper half of float32 values.
+_QINT8_CODE = 64
+_BFLOAT16_CODE = 65
+_SCALE = struct.Struct("<d")
+
+# Matches the dimensions in shape strings such as ``"[3, 4]"`` or ``"torch.Size([3, 4])"``.
+_SHAPE_DIMS = re.compile(r"-?\d+")
+
 
 def cast_dtype(raw: Union[None, np.dtype, "torch.dtype", str]) -> Optional[str]:
     """
@@ -85,6 +149,9 @@ def cast_dtype(raw: Union[None, np.dtype, "torch.dtype", str]) -> Optional[str]:
     Raises:
         Exception: If the raw value is of an invalid type.
     """
+    # Exact strings are what both the wire and :func:`Tensor.serialize` produce, resolve them before the torch checks.
+    if type(raw) is str and raw:
+        return _cast_dtype_str(raw)
     if not raw:
         return None
     if use_torch() and isinstance(raw, torch.dtype):
@@ -92,18 +159,23 @@ def cast_dtype(raw: Union[None, np.dtype, "torch.dtype", str]) -> Optional[str]:
     elif isinstance(raw, np.dtype):
         return dtypes[raw]
     elif isinstance(raw, str):
-        if use_torch():
-            assert raw in dtypes, f"{raw} not a valid torch type in dict {dtypes}"
-            return raw
-        else:
-            assert raw in dtypes, f"{raw} not a valid numpy type in dict {dtypes}"
-            return raw
+        return _cast_dtype_str(raw)
     else:
         raise Exception(
             f"{raw} of type {type(raw)} does not have a valid type in Union[None, numpy.dtype, torch.dtype, str]"
         )
 
 
+@functools.lru_cache(maxsize=128)
+def _cast_dtype_str(raw: str) -> str:
+    # Only valid names are cached, invalid ones raise on every call.
+    if use_torch():
+        assert raw in dtypes, f"{raw} not a valid torch type in dict {dtypes}"
+    else:
+        assert raw in dtypes, f"{raw} not a valid numpy type in dict {dtypes}"
+    return raw
+
+
 def cast_shape(raw: Union[None, list[int], str]) -> Optional[Union[str, list]]:
     """
     Casts the raw value to a string representing the tensor shape.
@@ -117,6 +189,9 @@ def cast_shape(raw: Union[None, list[int], str]) -> Optional[Union[str, list]]:
     Raises:
         Exception: If the raw value is of an invalid type or if the list elements are not of type int.
     """
+    # Exact lists of ints are the common case, accept them before the generic checks.
+    if type(raw) is list and raw and type(raw[0]) is int:
+        return raw
     if not raw:
         return None
     elif isinstance(raw, list):
@@ -125,18 +200,158 @@ def cast_shape(raw: Union[None, list[int], str]) -> Optional[Union[str, list]]:
         else:
             raise Exception(f"{raw} list elements are not of type int")
     elif isinstance(raw, str):
-        shape = list(map(int, raw.split("[")[1].split("]")[0].split(",")))
-        return shape
+        # The parsed shape is cached as a tuple, every caller gets its own list.
+        return list(_parse_shape(raw))
     else:
         raise Exception(
             f"{raw} of type {type(raw)} does not have a valid type in Union[None, list[int], str]"
         )
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_shape(raw: str) -> tuple[int, ...]:
+    return tuple(map(int, _SHAPE_DIMS.findall(raw)))
+
+
+def _dtype_name(dtype: Union[np.dtype, "torch.dtype"]) -> str:
+    if isinstance(dtype, np.dtype):
+        name = _NUMPY_DTYPE_NAMES.get(dtype)
+        if name is not None:
+            return name
+    return str(dtype)
+
+
+def _decode_msgpack_numpy(obj):
+    """
+    msgpack ``object_hook`` decoding the msgpack-numpy maps in buffers packed by earlier versions.
+
+    Follows ``msgpack_numpy.decode``, building arrays with their final shape over the packed data in one step, but
+    only for plain data types.
+    """
+    try:
+        if obj[b"nd"] is True:
+            if obj.get(b"kind", b"") != b"":
+                raise ValueError("Structured and object tensors cannot be decoded.")
+            return np.ndarray(
+                obj[b"shape"], dtype=_plain_dtype(obj[b"type"]), buffer=obj[b"data"]
+            )
+        return np.frombuffer(obj[b"data"], dtype=_plain_dtype(obj[b"type"]))[0]
+    except KeyError:
+        if b"complex" in obj:
+            data = obj[b"data"]
+            return complex(data.decode() if isinstance(data, bytes) else data)
+        return obj
+
+
+def _plain_dtype(descr) -> np.dtype:
+    """
+    Returns the dtype described by a serialized buffer, refusing structured and object dtypes.
+
+    An array of python objects built over received bytes would read them as raw pointers.
+    """
+    dtype = np.dtype(descr)
+    if dtype.hasobject or dtype.fields is not None:
+        raise ValueError(f"Tensors of type {dtype} cannot be decoded.")
+    return dtype
+
+
+def _encode_raw(array: "np.ndarray") -> Optional[bytes]:
+    """
+    Packs the array as the raw header followed by its little endian bytes, or returns ``None`` if its dtype has no
+    code.
+    """
+    raw = _raw_array(array)
+    if raw is None:
+        return None
+    code, array = raw
+    header = _raw_header(array.ndim).pack(
+        RAW_MAGIC, RAW_VERSION, code, array.ndim, *array.shape
+    )
+    # A single copy of the array data, straight into the output buffer.
+    return b"".join((header, array.data))
+
+
+def _decode_raw(buffer: bytes) -> "np.ndarray":
+    """
+    Returns a read-only view of the array data held in a raw buffer, or the dequantized ``float32`` array of a
+    quantized one.
+    """
+    _, version, code, ndim = _RAW_HEADER.unpack_from(buffer)
+    if version != RAW_VERSION:
+        raise ValueError(f"Unsupported raw tensor buffer version {version}.")
+    header = _raw_header(ndim)
+    shape = header.unpack_from(buffer)[4:]
+    if code == _QINT8_CODE:
+        (scale,) = _SCALE.unpack_from(buffer, header.size)
+        quantized = np.ndarray(
+            shape, dtype=np.int8, buffer=buffer, offset=header.size + _SCALE.size
+        )
+        return np.multiply(quantized, np.float32(scale), dtype=np.float32)
+    if code == _BFLOAT16_CODE:
+        upper = np.ndarray(shape, dtype="<u2", buffer=buffer, offset=header.size)
+        return (upper.astype(np.uint32) << 16).view(np.float32)
+    return np.ndarray(
+        shape, dtype=_CODE_DTYPES[code], buffer=buffer, offset=header.size
+    )
+
+
+def _raw_array(array: "np.ndarray") -> Optional[tuple[int, "np.ndarray"]]:
+    """Returns the dtype code and the contiguous little endian array, or ``None`` if its dtype has no code."""
+    dtype = array.dtype.newbyteorder("<")
+    code = _DTYPE_CODES.get(dtype)
+    if code is None:
+        return None
+    return code, np.asarray(array, dtype=dtype, order="C")
+
+
+@functools.lru_cache(maxsize=64)
+def _many_entry(ndim: int) -> struct.Struct:
+    """
+    Returns the compiled struct of a :func:`Tensor.serialize_many` table entry: dtype code, number of dimensions,
+    offset and size of the data in the data region, then the shape.
+    """
+    return struct.Struct(f"<BB6xQQ{ndim}q")
+
+
+@functools.lru_cache(maxsize=64)
+def _raw_header(ndim: int) -> struct.Struct:
+    """Returns the compiled struct of the full raw header, shape included, for arrays of ``ndim`` dimensions."""
+    return struct.Struct(f"<BBBB{ndim}q")
+
+
+# Per thread msgpack packers reused by :func:`Tensor.serialize`, so each call does not allocate a new one.
+_packers = threading.local()
+
+# Packers whose buffer grew beyond this many bytes are dropped, rather than keeping the memory alive.
+_PACKER_RETAIN_LIMIT = 1 << 20
+
+
+def _pack(obj) -> bytes:
+    packer = getattr(_packers, "packer", None)
+    if packer is None:
+        packer = _packers.packer = msgpack.Packer(
+            default=msgpack_numpy.encode, use_bin_type=True, autoreset=False
+        )
+    try:
+        packer.pack(obj)
+        data = packer.bytes()
+    finally:
+        packer.reset()
+    if len(data) > _PACKER_RETAIN_LIMIT:
+        _packers.packer = None
+    return data
+
+
 class tensor:
     def __new__(cls, tensor: Union[list, "np.ndarray", "torch.Tensor"]):
-        if isinstance(tensor, list) or isinstance(tensor, np.ndarray):
-            tensor = torch.tensor(tensor) if use_torch() else np.array(tensor)
+        # as_tensor/asarray convert lists and hand back arrays of the right kind as they are, without a copy.
+        if not use_torch():
+            tensor = np.asarray(tensor)
+        elif isinstance(tensor, np.ndarray) and not tensor.flags.writeable:
+            # torch warns about sharing read-only memory, such as deserialized buffers, so those are copied.
+            tensor = torch.from_numpy(tensor.copy())
+        else:
+            tensor = torch.as_tensor(tensor)
         return Tensor.serialize(tensor_=tensor)
 
 
@@ -145,58 +360,169 @@ class Tensor(BaseModel):
     Represents a Tensor object.
 
     Args:
-        buffer (Optional[str]): Tensor buffer data.
+        buffer (Optional[Union[str, bytes]]): Tensor buffer data, either base64 encoded text or raw bytes.
         dtype (str): Tensor data type.
         shape (list[int]): Tensor shape.
     """
 
-    model_config = ConfigDict(validate_assignment=True)
+    # Every field is frozen, so validating assignments would only add work to each attribute set.
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
 
     def tensor(self) -> Union[np.ndarray, "torch.Tensor"]:
         return self.deserialize()
 
     def tolist(self) -> list[object]:
-        return self.deserialize().tolist()
+        # The list holds its own values, a view of the buffer is enough to build it.
+        return self.deserialize(copy=False).tolist()
+
+    def iter_elements(self, chunk: int = 4096) -> Iterator[list[object]]:
+        """
+        Iterates over the flattened tensor elements as lists of at most ``chunk`` python values.
+
+        Unlike :func:`tolist`, the whole tensor is never materialized as python objects at once, which suits
+        consumers that only stream through the values.
+
+        Args:
+            chunk (int): The maximum number of elements per list, at least ``1``.
+
+        Returns:
+            Iterator[list[object]]: The chunks of elements, in order.
+
+        Raises:
+            ValueError: If ``chunk`` is not a positive integer.
+        """
+        # Checked here rather than in a generator body, so the error is raised on the call itself.
+        if not isinstance(chunk, int) or chunk < 1:
+            raise ValueError(f"chunk must be a positive integer, got {chunk!r}.")
+        numpy_object = self.deserialize(copy=False)
+        if use_torch():
+            numpy_object = numpy_object.numpy()
+        flat = numpy_object.reshape(-1)
+        return (
+            flat[start : start + chunk].tolist() for start in range(0, flat.size, chunk)
+        )
+
+    def raw_bytes(self) -> memoryview:
+        """
+        Returns the tensor data bytes, as they are stored in the buffer, without deserializing them into a tensor.
+
+        For raw buffers this is a view of the buffer past its header, no data is copied. Quantized buffers hand back
+        their quantized payload rather than the restored ``float32`` values.
+
+        Returns:
+            memoryview: The read-only array data bytes.
+        """
+        buffer_bytes = self._buffer_bytes()
+        if buffer_bytes[:1] == bytes([RAW_MAGIC]):
+            _, version, code, ndim = _RAW_HEADER.unpack_from(buffer_bytes)
+            if version != RAW_VERSION:
+                raise ValueError(f"Unsupported raw tensor buffer version {version}.")
+            offset = _raw_header(ndim).size
+            if code == _QINT8_CODE:
+                offset += _SCALE.size
+            return memoryview(buffer_bytes)[offset:]
+        # Flattened first, a memoryview cannot be cast when the shape holds a zero. Legacy scalars decode to numpy
+        # scalars, whose flattened copy is writable.
+        array = np.asarray(self._unpack()).reshape(-1)
+        return memoryview(array).cast("B").toreadonly()
 
     def numpy(self) -> "np.ndarray":
         return (
             self.deserialize().detach().numpy() if use_torch() else self.deserialize()
         )
 
-    def deserialize(self) -> Union["np.ndarray", "torch.Tensor"]:
+    def deserialize(self, copy: bool = True) -> Union["np.ndarray", "torch.Tensor"]:
         """
         Deserializes the Tensor object.
 
+        Args:
+            copy (bool): If ``True``, the returned array owns its data and can be written to. If ``False``, a numpy
+                array in the tensor data type is returned as a read-only view aliasing the decoded buffer whenever no
+                cast is needed, saving a copy. The view keeps the buffer alive. Torch tensors cannot be read-only, so
+                they are always copied.
+
         Returns:
             np.array or torch.Tensor: The deserialized tensor object.
 
         Raises:
             Exception: If the deserialization process encounters an error.
         """
-        shape = tuple(self.shape)
-        buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
-        numpy_object = msgpack.unpackb(
-            buffer_bytes, object_hook=msgpack_numpy.decode
-        ).copy()
+        numpy_object = self._unpack()
         if use_torch():
-            torch_object = torch.as_tensor(numpy_object)
-            # Reshape does not work for (0) or [0]
-            if not (len(shape) == 1 and shape[0] == 0):
-                torch_object = torch_object.reshape(shape)
-            return torch_object.type(dtypes[self.dtype])
+            # The unpacked array is a read-only view of the buffer, so torch gets its own copy, cast in the same pass.
+            return torch.tensor(numpy_object, dtype=dtypes[self.dtype])
         else:
-            # Reshape does not work for (0) or [0]
-            if not (len(shape) == 1 and shape[0] == 0):
-                numpy_object = numpy_object.reshape(shape)
-            return numpy_object.astype(dtypes[self.dtype])
+            target = dtypes[self.dtype]
+            if numpy_object.dtype != target:
+                return numpy_object.astype(target, copy=False)
+            # Matching dtype, only copy when the view of the buffer cannot be written to.
+            if not copy or numpy_object.flags.writeable:
+                return numpy_object
+            return numpy_object.copy()
+
+    def deserialize_readonly(self) -> "np.ndarray":
+        """
+        Deserializes the Tensor object into a numpy array without copying the data.
+
+        The returned array is a read-only view of the decoded buffer, kept in the data type it was serialized with. Use
+        :func:`deserialize` when a writable array or a torch tensor is needed.
+
+        Returns:
+            np.array: The read-only deserialized array.
+
+        Raises:
+            Exception: If the deserialization process encounters an error.
+        """
+        return self._unpack()
+
+    def __reduce_ex__(self, protocol):
+        # With pickle protocol 5 raw buffers travel as a PickleBuffer, which framing transports can send out-of-band
+        # without copying. Text buffers are plain strings and pickle as they are, as do subclasses with their own state.
+        if protocol >= 5 and type(self) is Tensor and isinstance(self.buffer, bytes):
+            return (
+                _rebuild_tensor,
+                (self.dtype, list(self.shape), PickleBuffer(self.buffer)),
+            )
+        return super().__reduce_ex__(protocol)
+
+    def _buffer_bytes(self) -> bytes:
+        return (
+            self.buffer
+            if isinstance(self.buffer, bytes)
+            else base64.b64decode(self.buffer)
+        )
+
+    def _unpack(self) -> "np.ndarray":
+        shape = tuple(self.shape)
+        buffer_bytes = self._buffer_bytes()
+        if buffer_bytes[:1] == bytes([RAW_MAGIC]):
+            numpy_object = _decode_raw(buffer_bytes)
+        else:
+            # Buffers that are not raw hold the msgpack-numpy maps of earlier versions.
+            numpy_object = msgpack.unpackb(
+                buffer_bytes, raw=False, object_hook=_decode_msgpack_numpy
+            )
+        # Reshape does not work for (0) or [0]
+        if numpy_object.shape != shape and not (len(shape) == 1 and shape[0] == 0):
+            numpy_object = numpy_object.reshape(shape)
+        return numpy_object
 
     @staticmethod
-    def serialize(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
+    def serialize(
+        tensor_: Union["np.ndarray", "torch.Tensor"],
+        as_text: bool = True,
+        raw: bool = False,
+    ) -> "Tensor":
         """
         Serializes the given tensor.
 
         Args:
             tensor_ (np.array or torch.Tensor): The tensor to serialize.
+            as_text (bool): If ``True``, the buffer is stored as base64 encoded text, which is what the JSON transport
+                of synapses expects. If ``False``, the raw bytes are kept and only encoded when the model is dumped.
+            raw (bool): If ``True``, the array is packed as a raw header followed by its bytes, which is faster to
+                pack and decode but cannot be read by earlier releases. If ``False``, it is packed with
+                msgpack-numpy as by earlier versions.
 
         Returns:
             :func:`Tensor`: The serialized tensor.
@@ -204,18 +530,285 @@ class Tensor(BaseModel):
         Raises:
             Exception: If the serialization process encounters an error.
         """
-        dtype = str(tensor_.dtype)
+        dtype = _dtype_name(tensor_.dtype)
         shape = list(tensor_.shape)
         if len(shape) == 0:
             shape = [0]
-        tensor__ = tensor_.cpu().detach().numpy().copy() if use_torch() else tensor_
-        data_buffer = base64.b64encode(
-            msgpack.packb(tensor__, default=msgpack_numpy.encode)
-        ).decode("utf-8")
+        tensor__ = tensor_.cpu().detach().numpy() if use_torch() else tensor_
+        data_buffer = None
+        if raw and isinstance(tensor__, np.ndarray):
+            data_buffer = _encode_raw(tensor__)
+        if data_buffer is None:
+            data_buffer = _pack(tensor__)
+        if as_text:
+            data_buffer = base64.b64encode(data_buffer).decode("utf-8")
         return Tensor(buffer=data_buffer, shape=shape, dtype=dtype)
 
+    @staticmethod
+    def specialize(
+        dtype: str, shape: Union[list[int], tuple[int, ...]]
+    ) -> "SpecializedTensor":
+        """
+        Returns a serializer specialized for numpy arrays of one fixed data type and shape.
+
+        Subnets usually exchange tensors of a constant type and size, e.g. ``float32`` weights for 256 neurons. The
+        specialized serializer prebuilds the buffer header and resolves the data type once, so serializing and
+        deserializing such tensors skips the per call lookups. Its buffers are the same as the ones of
+        :func:`serialize` with ``raw=True``. Serializers are cached per data type and shape.
+
+        Args:
+            dtype (str): The numpy data type name, such as ``"float32"``.
+            shape (Union[list[int], tuple[int, ...]]): The fixed shape of the arrays.
+
+        Returns:
+            :func:`SpecializedTensor`: The specialized serializer.
+
+        Raises:
+            ValueError: If the data type cannot be serialized.
+        """
+        return _specialize(dtype, tuple(shape))
+
+    @staticmethod
+    def serialize_quantized(
+        tensor_: Union["np.ndarray", "torch.Tensor"],
+        bits: int = 8,
+        as_text: bool = True,
+    ) -> "Tensor":
+        """
+        Serializes the given float tensor with reduced precision, for payloads such as normalized weights.
+
+        With ``bits=8`` the values are scaled by their maximum magnitude and rounded to ``int8``, one byte per value,
+        with the per tensor scale stored in the buffer header. With ``bits=16`` they are rounded to ``bfloat16``.
+        :func:`deserialize` restores ``float32`` values, up to the quantization error.
+
+        Args:
+            tensor_ (np.array or torch.Tensor): The float tensor to serialize.
+            bits (int): The bits per value, ``8`` or ``16``.
+            as_text (bool): Whether to store the buffer as base64 encoded text, see :func:`serialize`.
+
+        Returns:
+            :func:`Tensor`: The serialized tensor, of ``float32`` data type.
+
+        Raises:
+            ValueError: If the tensor is not a float tensor, holds non finite values or values beyond the range of the
+                quantized type, or ``bits`` is not supported.
+        """
+        dtype = "torch.float32" if use_torch() else "float32"
+        numpy_object = tensor_.cpu().detach().numpy() if use_torch() else tensor_
+        numpy_object = np.asarray(numpy_object)
+        if numpy_object.dtype.kind != "f":
+            raise ValueError(
+                f"Only float tensors can be quantized, got {numpy_object.dtype}."
+            )
+        if not np.isfinite(numpy_object).all():
+            raise ValueError("Only finite values can be quantized.")
+        # Checked on the input, wider floats would overflow to inf in the float32 cast.
+        peak = np.abs(numpy_object).max() if numpy_object.size else 0.0
+        if peak > np.finfo(np.float32).max:
+            raise ValueError("Values beyond the float32 range cannot be quantized.")
+        # C order, so the quantized arrays below can be joined into the buffer whatever the input layout.
+        values = np.asarray(numpy_object, dtype=np.float32, order="C")
+        if bits == 8:
+            code = _QINT8_CODE
+            # Computed in float32 as deserialize applies it, a scale that underflows to zero only occurs for peaks
+            # that round to zero anyway.
+            scale = np.float32(peak) / np.float32(127)
+            if scale == 0:
+                scale = np.float32(1)
+            quantized = np.rint(values / scale)
+            # Subnormal scales are inexact, the peak may land just beyond 127.
+            np.clip(quantized, -127, 127, out=quantized)
+            data = (_SCALE.pack(scale), quantized.astype("<i1").data)
+        elif bits == 16:
+            code = _BFLOAT16_CODE
+            # Round to nearest even on the 16 bits dropped from the float32 mantissa.
+            words = values.view(np.uint32)
+            rounding = np.uint32(0x7FFF) + ((words >> np.uint32(16)) & np.uint32(1))
+            upper = ((words + rounding) >> np.uint32(16)).astype("<u2")
+            # An all ones exponent means the value rounded up past the largest bfloat16.
+            if ((upper & np.uint16(0x7F80)) == np.uint16(0x7F80)).any():
+                raise ValueError(
+                    "Values beyond the bfloat16 range cannot be quantized."
+                )
+            data = (upper.data,)
+        else:
+            raise ValueError(f"Quantization to {bits} bits is not supported.")
+        header = _raw_header(values.ndim).pack(
+            RAW_MAGIC, RAW_VERSION, code, values.ndim, *values.shape
+        )
+        data_buffer = b"".join((header, *data))
+        if as_text:
+            data_buffer = base64.b64encode(data_buffer).decode("utf-8")
+        return Tensor(buffer=data_buffer, shape=list(values.shape) or [0], dtype=dtype)
+
+    @staticmethod
+    def serialize_frames(
+        tensor_: Union["np.ndarray", "torch.Tensor"],
+    ) -> tuple[bytes, list[PickleBuffer]]:
+        """
+        Serializes the given tensor into a small header and out-of-band data frames.
+
+        The frames wrap the memory of the (contiguous) array without copying it, so transports that accept a list of
+        frames can send them as they are. The header starts with a version byte followed by the msgpack encoded dtype
+        and shape.
+
+        Args:
+            tensor_ (np.array or torch.Tensor): The tensor to serialize.
+
+        Returns:
+            tuple[bytes, list[PickleBuffer]]: The header and the data frames.
+
+        Raises:
+            ValueError: If the tensor holds python objects.
+        """
+        numpy_object = tensor_.cpu().detach().numpy() if use_torch() else tensor_
+        numpy_object = np.asarray(numpy_object, order="C")
+        if numpy_object.dtype.hasobject:
+            raise ValueError("Tensors holding python objects cannot be framed.")
+        header = bytes([FRAMES_VERSION]) + msgpack.packb(
+            [numpy_object.dtype.str, list(numpy_object.shape)]
+        )
+        return header, [PickleBuffer(numpy_object)]
+
+    @staticmethod
+    def deserialize_frames(header: bytes, frames: list) -> "np.ndarray":
+        """
+        Rebuilds an array from the header and data frames produced by :func:`serialize_frames`.
+
+        The array is a view of the first frame, no data is copied. It is read-only unless the frame is writable.
+
+        Args:
+            header (bytes): The header produced by :func:`serialize_frames`.
+            frames (list): The data frames, any objects supporting the buffer protocol.
+
+        Returns:
+            np.array: The deserialized array.
+
+        Raises:
+            ValueError: If the header version or the data type is not supported, or the header or frames are
+                malformed.
+        """
+        if not header:
+            raise ValueError("Empty tensor frames header.")
+        if header[0] != FRAMES_VERSION:
+            raise ValueError(f"Unsupported tensor frames version {header[0]}.")
+        try:
+            dtype, shape = msgpack.unpackb(memoryview(header)[1:])
+            dtype = _plain_dtype(dtype)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Malformed tensor frames header.") from e
+        if not isinstance(shape, list) or not all(
+            isinstance(dim, int) and dim >= 0 for dim in shape
+        ):
+            raise ValueError(f"Malformed tensor frames shape {shape}.")
+        if not frames:
+            raise ValueError("Missing tensor data frame.")
+        frame = memoryview(frames[0])
+        if frame.nbytes != math.prod(shape) * dtype.itemsize:
+            raise ValueError(
+                f"Tensor data frame of {frame.nbytes} bytes does not match {dtype} {shape}."
+            )
+        return np.ndarray(shape, dtype=dtype, buffer=frame)
+
+    @staticmethod
+    def serialize_many(tensors: list[Union["np.ndarray", "torch.Tensor"]]) -> bytes:
+        """
+        Serializes several tensors into a single buffer.
+
+        The buffer holds a header with the number of tensors, a table with the dtype, shape, offset and size of each
+        tensor, and a data region with the tensors' bytes, each padded to 8 bytes. Every tensor is copied once, into
+        the one output buffer.
+
+        Args:
+            tensors (list[np.array or torch.Tensor]): The tensors to serialize.
+
+        Returns:
+            bytes: The serialized tensors.
+
+        Raises:
+            ValueError: If a tensor has a data type that cannot be serialized.
+        """
+        entries = []
+        chunks = []
+        offset = 0
+        for tensor_ in tensors:
+            numpy_object = tensor_.cpu().detach().numpy() if use_torch() else tensor_
+            raw = _raw_array(np.asarray(numpy_object))
+            if raw is None:
+                raise ValueError(
+                    f"Tensors of type {numpy_object.dtype} cannot be serialized."
+                )
+            code, array = raw
+            entries.append(
+                _many_entry(array.ndim).pack(
+                    code, array.ndim, offset, array.nbytes, *array.shape
+                )
+            )
+            chunks.append(array.data)
+            padding = -array.nbytes % 8
+            if padding:
+                chunks.append(bytes(padding))
+            offset += array.nbytes + padding
+        table = b"".join(entries)
+        header = _MANY_HEADER.pack(
+            MANY_VERSION, len(entries), _MANY_HEADER.size + len(table)
+        )
+        return b"".join((header, table, *chunks))
+
+    @staticmethod
+    def deserialize_many(buffer: bytes) -> list["np.ndarray"]:
+        """
+        Rebuilds the arrays serialized by :func:`serialize_many`.
+
+        The arrays are views of the given buffer and share its memory, no data is copied. They are read-only unless
+        the buffer is writable.
+
+        Args:
+            buffer (bytes): The buffer produced by :func:`serialize_many`.
+
+        Returns:
+            list[np.array]: The deserialized arrays.
+
+        Raises:
+            ValueError: If the buffer version is not supported or the buffer is malformed.
+        """
+        size = len(buffer)
+        if size < _MANY_HEADER.size:
+            raise ValueError("Truncated tensor batch header.")
+        version, count, data_start = _MANY_HEADER.unpack_from(buffer)
+        if version != MANY_VERSION:
+            raise ValueError(f"Unsupported tensor batch version {version}.")
+        arrays = []
+        position = _MANY_HEADER.size
+        for _ in range(count):
+            if position + 2 > size:
+                raise ValueError("Truncated tensor batch table.")
+            entry = _many_entry(buffer[position + 1])
+            if position + entry.size > size:
+                raise ValueError("Truncated tensor batch table.")
+            code, _, offset, nbytes, *shape = entry.unpack_from(buffer, position)
+            position += entry.size
+            dtype = _CODE_DTYPES.get(code)
+            if dtype is None:
+                raise ValueError(f"Unknown tensor batch dtype code {code}.")
+            if (
+                any(dim < 0 for dim in shape)
+                or nbytes != math.prod(shape) * dtype.itemsize
+            ):
+                raise ValueError(
+                    f"Tensor batch entry of {nbytes} bytes does not match its shape {shape}."
+                )
+            if data_start + offset + nbytes > size:
+                raise ValueError("Tensor batch entry extends beyond the buffer.")
+            arrays.append(
+                np.ndarray(
+                    tuple(shape), dtype=dtype, buffer=buffer, offset=data_start + offset
+                )
+            )
+        return arrays
+
     # Represents the tensor buffer data.
-    buffer: Optional[str] = Field(
+    buffer: Optional[Union[str, bytes]] = Field(
         default=None,
         title="buffer",
         description="Tensor buffer data. This field stores the serialized representation of the tensor data.",
@@ -242,8 +835,122 @@ class Tensor(BaseModel):
         repr=True,
     )
 
+    # Keep the dumped buffer JSON compatible when raw bytes are held.
+    @field_serializer("buffer")
+    def _serialize_buffer(self, buffer: Optional[Union[str, bytes]]) -> Optional[str]:
+        if isinstance(buffer, bytes):
+            return base64.b64encode(buffer).decode("utf-8")
+        return buffer
+
     # Extract the represented shape of the tensor.
     _extract_shape = field_validator("shape", mode="before")(cast_shape)
 
     # Extract the represented data type of the tensor.
     _extract_dtype = field_validator("dtype", mode="before")(cast_dtype)
+
+
+def _rebuild_tensor(dtype: str, shape: list[int], buffer) -> "Tensor":
+    """Rebuilds a tensor pickled by :func:`Tensor.__reduce_ex__` from its raw buffer."""
+    # Out-of-band buffers come back as any object supporting the buffer protocol.
+    if not isinstance(buffer, bytes):
+        buffer = bytes(buffer)
+    return Tensor(buffer=buffer, dtype=dtype, shape=shape)
+
+
+class SpecializedTensor:
+    """
+    Serializer for numpy arrays of one fixed data type and shape, created by :func:`Tensor.specialize`.
+
+    Args:
+        dtype (str): The numpy data type name of the arrays.
+        shape (tuple[int, ...]): The shape of the arrays.
+    """
+
+    def __init__(self, dtype: str, shape: tuple[int, ...]):
+        # Checked before resolving the name, numpy does not know the torch ones.
+        if dtype not in dtypes or dtype.startswith("torch."):
+            raise ValueError(f"Tensors of type {dtype} cannot be specialized.")
+        self.dtype = dtype
+        self.shape = shape
+        self._numpy_dtype = np.dtype(dtype)
+        self._raw_dtype = self._numpy_dtype.newbyteorder("<")
+        code = _DTYPE_CODES.get(self._raw_dtype)
+        if code is None:
+            raise ValueError(f"Tensors of type {dtype} cannot be specialized.")
+        self._header = _raw_header(len(shape)).pack(
+            RAW_MAGIC, RAW_VERSION, code, len(shape), *shape
+        )
+        self._size = len(self._header) + math.prod(shape) * self._numpy_dtype.itemsize
+        # Scalars are serialized with the [0] shape, see Tensor.serialize.
+        self._tensor_shape = list(shape) or [0]
+
+    def serialize(self, array: "np.ndarray", as_text: bool = True) -> "Tensor":
+        """
+        Serializes the given array with the raw layout, see :func:`Tensor.serialize`.
+
+        Args:
+            array (np.array): The array to serialize, of the specialized data type and shape.
+            as_text (bool): Whether to store the buffer as base64 encoded text.
+
+        Returns:
+            :func:`Tensor`: The serialized tensor.
+
+        Raises:
+            ValueError: If the array data type or shape differ from the specialized ones.
+        """
+        if array.dtype != self._numpy_dtype or array.shape != self.shape:
+            raise ValueError(
+                f"Expected an array of type {self.dtype} and shape {self.shape}, got {array.dtype} {array.shape}."
+            )
+        array = np.asarray(array, dtype=self._raw_dtype, order="C")
+        data_buffer = b"".join((self._header, array.data))
+        if as_text:
+            data_buffer = base64.b64encode(data_buffer).decode("utf-8")
+        return Tensor(buffer=data_buffer, shape=self._tensor_shape, dtype=self.dtype)
+
+    def deserialize(self, tensor_: "Tensor") -> "np.ndarray":
+        """
+        Deserializes the given tensor into a writable array, see :func:`Tensor.deserialize`.
+
+        Args:
+            tensor_ (:func:`Tensor`): The tensor to deserialize.
+
+        Returns:
+            np.array: The deserialized array.
+        """
+        return self.deserialize_readonly(tensor_).copy()
+
+    def deserialize_readonly(self, tensor_: "Tensor") -> "np.ndarray":
+        """
+        Deserializes the given tensor into a read-only view of its buffer, see :func:`Tensor.deserialize_readonly`.
+
+        Tensors that were not packed with the specialized header go through :func:`Tensor.deserialize_readonly`.
+
+        Args:
+            tensor_ (:func:`Tensor`): The tensor to deserialize.
+
+        Returns:
+            np.array: The read-only deserialized array.
+
+        Raises:
+            ValueError: If the tensor data type or shape differ from the specialized ones.
+        """
+        buffer = tensor_._buffer_bytes()
+        if len(buffer) != self._size or not buffer.startswith(self._header):
+            array = tensor_.deserialize_readonly()
+            if (
+                array.dtype.newbyteorder("<") != self._raw_dtype
+                or array.shape != self.shape
+            ):
+                raise ValueError(
+                    f"Expected a tensor of type {self.dtype} and shape {self.shape}, got {array.dtype} {array.shape}."
+                )
+            return array
+        return np.ndarray(
+            self.shape, dtype=self._raw_dtype, buffer=buffer, offset=len(self._header)
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _specialize(dtype: str, shape: tuple[int, ...]) -> SpecializedTensor:
+    return SpecializedTensor(dtype, shape)
@@ -15,12 +15,24 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import base64
+import pickle
+import warnings
+
+import msgpack
+import msgpack_numpy
 import numpy
 import numpy as np
+import pydantic
 import pytest
 import torch
 
-from bittensor.core.tensor import Tensor
+from bittensor.core.tensor import (
+    RAW_MAGIC,
+    Tensor,
+    cast_shape,
+    tensor as tensor_factory,
+)
 
 
 # This is a fixture that creates an example tensor for testing
@@ -243,3 +255,347 @@ def test_serialize_all_types_equality_torch(force_legacy_torch_compatible_api):
 
     torchtensor = torch.randn([100], dtype=torch.float32) < 0.5
     assert torch.all(Tensor.serialize(torchtensor).tensor() == torchtensor)
+
+
+def test_serialize_raw_bytes():
+    tensor = np.array([[1.5, 2.5], [3.5, 4.5]], dtype=np.float32)
+    serialized = Tensor.serialize(tensor, as_text=False)
+
+    assert isinstance(serialized.buffer, bytes)
+    assert np.array_equal(serialized.deserialize(), tensor)
+
+    # The dumped buffer stays base64 text so synapses remain JSON serializable.
+    dumped = serialized.model_dump()
+    assert dumped["buffer"] == Tensor.serialize(tensor).buffer
+    assert np.array_equal(Tensor(**dumped).deserialize(), tensor)
+
+
+def test_deserialize_readonly(example_tensor):
+    tensor = example_tensor.deserialize_readonly()
+
+    assert isinstance(tensor, np.ndarray)
+    assert not tensor.flags.writeable
+    assert tensor.tolist() == [1, 2, 3, 4]
+
+    # deserialize still hands out an array the caller owns.
+    assert example_tensor.deserialize().flags.writeable
+
+
+def test_serialize_frames():
+    tensor = np.arange(12, dtype=np.int32).reshape(3, 4)
+    header, frames = Tensor.serialize_frames(tensor)
+
+    # The frame shares memory with the serialized array.
+    assert np.shares_memory(np.asarray(frames[0]), tensor)
+
+    result = Tensor.deserialize_frames(header, [bytes(frames[0])])
+    assert result.dtype == tensor.dtype
+    assert np.array_equal(result, tensor)
+
+
+def test_serialize_frames_scalar():
+    header, frames = Tensor.serialize_frames(np.array(1.5, dtype=np.float32))
+
+    result = Tensor.deserialize_frames(header, [bytes(frames[0])])
+    assert result.shape == ()
+    assert result == 1.5
+
+
+def test_deserialize_frames_unknown_version():
+    header, frames = Tensor.serialize_frames(np.array([1, 2, 3]))
+
+    with pytest.raises(ValueError):
+        Tensor.deserialize_frames(b"\x00" + header[1:], frames)
+
+
+def test_deserialize_frames_malformed():
+    header, frames = Tensor.serialize_frames(np.array([1, 2, 3], dtype=np.int32))
+
+    for malformed_header, malformed_frames in (
+        (b"", frames),
+        (header[:3], frames),
+        (header, []),
+        (header, [bytes(frames[0])[:-1]]),
+    ):
+        with pytest.raises(ValueError):
+            Tensor.deserialize_frames(malformed_header, malformed_frames)
+
+
+def test_deserialize_casts_to_declared_dtype():
+    serialized = Tensor.serialize(np.array([1, 2, 3], dtype=np.int64))
+    tensor = Tensor(buffer=serialized.buffer, dtype="float32", shape=[3])
+
+    result = tensor.deserialize()
+    assert result.dtype == np.float32
+    assert result.flags.writeable
+    assert result.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_deserialize_legacy_msgpack_numpy_buffer():
+    # Buffers packed with msgpack-numpy by older versions still deserialize.
+    tensor = np.arange(6, dtype=np.float64).reshape(2, 3)
+    buffer = base64.b64encode(
+        msgpack.packb(tensor, default=msgpack_numpy.encode)
+    ).decode("utf-8")
+
+    result = Tensor(buffer=buffer, dtype="float64", shape=[2, 3]).deserialize()
+    assert np.array_equal(result, tensor)
+
+
+def test_cast_shape_from_string():
+    first = cast_shape("[3, 4]")
+    assert first == [3, 4]
+
+    # Parsed shapes are cached, but callers never share the returned list.
+    first.append(5)
+    assert cast_shape("[3, 4]") == [3, 4]
+    assert cast_shape("torch.Size([2, 8])") == [2, 8]
+
+
+def test_tensor_factory():
+    assert tensor_factory([1, 2, 3]).tolist() == [1, 2, 3]
+
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+    serialized = tensor_factory(data)
+    assert serialized.dtype == "float32"
+    assert serialized.shape == [2, 3]
+    assert np.array_equal(serialized.deserialize(), data)
+
+
+def test_tensor_factory_torch(force_legacy_torch_compatible_api):
+    serialized = tensor_factory(np.array([1.0, 2.0], dtype=np.float32))
+    assert serialized.dtype == "torch.float32"
+    assert serialized.tolist() == [1.0, 2.0]
+
+
+def test_tensor_factory_torch_readonly(force_legacy_torch_compatible_api):
+    data = np.frombuffer(np.array([1.0, 2.0], dtype=np.float32).tobytes(), np.float32)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        serialized = tensor_factory(data)
+    assert serialized.tolist() == [1.0, 2.0]
+
+
+def test_tensor_is_frozen(example_tensor):
+    with pytest.raises(pydantic.ValidationError):
+        example_tensor.dtype = "float32"
+
+
+def test_serialize_raw_layout():
+    tensor = np.arange(6, dtype=np.int16).reshape(3, 2)
+    serialized = Tensor.serialize(tensor, as_text=False, raw=True)
+
+    assert serialized.buffer[0] == RAW_MAGIC
+    # The array data follows the header as is.
+    assert serialized.buffer.endswith(tensor.tobytes())
+    assert np.array_equal(serialized.deserialize(), tensor)
+
+
+def test_serialize_legacy_layout():
+    tensor = np.arange(6, dtype=np.int16).reshape(3, 2)
+    serialized = Tensor.serialize(tensor, as_text=False)
+
+    # Earlier releases decode the buffer with msgpack-numpy.
+    result = msgpack.unpackb(serialized.buffer, object_hook=msgpack_numpy.decode)
+    assert np.array_equal(result, tensor)
+
+
+def test_serialize_many():
+    tensors = [
+        np.arange(5, dtype=np.int8),
+        np.ones((2, 3), dtype=np.float32),
+        np.array(True),
+        np.zeros((0,), dtype=np.float64),
+    ]
+    buffer = Tensor.serialize_many(tensors)
+
+    result = Tensor.deserialize_many(buffer)
+    assert len(result) == len(tensors)
+    for array, expected in zip(result, tensors):
+        assert array.dtype == expected.dtype
+        assert array.shape == expected.shape
+        assert np.array_equal(array, expected)
+        # Every array is a view of the one buffer, aligned to 8 bytes.
+        assert array.base is not None
+        assert array.flags.aligned
+
+
+def test_deserialize_many_malformed():
+    buffer = Tensor.serialize_many([np.arange(4, dtype=np.int32)])
+
+    unknown_code = bytearray(buffer)
+    unknown_code[16] = 64
+    wrong_size = bytearray(buffer)
+    wrong_size[32] += 1
+    for malformed in (buffer[:8], buffer[:20], buffer[:-1], unknown_code, wrong_size):
+        with pytest.raises(ValueError):
+            Tensor.deserialize_many(bytes(malformed))
+
+
+def test_serialize_many_unsupported_dtype():
+    with pytest.raises(ValueError):
+        Tensor.serialize_many([np.zeros(2, dtype=np.complex64)])
+
+
+def test_deserialize_rejects_object_dtype():
+    # A legacy map claiming an object dtype would turn the received bytes into pointers.
+    buffer = msgpack.packb(
+        {b"nd": True, b"type": "|O", b"kind": b"", b"shape": [1], b"data": bytes(8)}
+    )
+
+    with pytest.raises(ValueError):
+        Tensor(buffer=buffer, dtype="float32", shape=[1]).deserialize()
+
+
+def test_specialize():
+    specialized = Tensor.specialize("float32", (4, 2))
+    assert Tensor.specialize("float32", [4, 2]) is specialized
+
+    data = np.arange(8, dtype=np.float32).reshape(4, 2)
+    serialized = specialized.serialize(data)
+
+    # Specialized buffers are interchangeable with the generic ones.
+    assert serialized.buffer == Tensor.serialize(data, raw=True).buffer
+    assert np.array_equal(specialized.deserialize(serialized), data)
+    assert np.array_equal(specialized.deserialize(Tensor.serialize(data)), data)
+
+    with pytest.raises(ValueError):
+        specialized.serialize(np.zeros((4, 2), dtype=np.float64))
+    with pytest.raises(ValueError):
+        specialized.deserialize(Tensor.serialize(np.zeros((4, 2), dtype=np.float64)))
+    with pytest.raises(ValueError):
+        specialized.deserialize(Tensor.serialize(np.zeros(8, dtype=np.float32)))
+
+
+@pytest.mark.parametrize("dtype", ["torch.float32", "complex64", "object"])
+def test_specialize_invalid_dtype(dtype):
+    with pytest.raises(ValueError):
+        Tensor.specialize(dtype, (4,))
+
+
+def test_deserialize_without_copy(example_tensor):
+    tensor = example_tensor.deserialize(copy=False)
+
+    assert not tensor.flags.writeable
+    assert tensor.tolist() == [1, 2, 3, 4]
+
+
+def test_iter_elements():
+    data = np.arange(10, dtype=np.int32).reshape(2, 5)
+    chunks = list(Tensor.serialize(data).iter_elements(chunk=4))
+
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@pytest.mark.parametrize("chunk", [0, -1, 2.5])
+def test_iter_elements_invalid_chunk(example_tensor, chunk):
+    with pytest.raises(ValueError):
+        example_tensor.iter_elements(chunk=chunk)
+
+
+def test_raw_bytes():
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+    raw = Tensor.serialize(data).raw_bytes()
+
+    assert isinstance(raw, memoryview)
+    assert raw.readonly
+    assert raw.tobytes() == data.tobytes()
+
+
+def test_raw_bytes_empty():
+    data = np.zeros((0, 3), dtype=np.float32)
+
+    assert Tensor.serialize(data).raw_bytes().tobytes() == b""
+
+
+def test_raw_bytes_scalar():
+    raw = Tensor.serialize(np.float32(2.5)).raw_bytes()
+
+    assert raw.readonly
+    assert raw.tobytes() == np.float32(2.5).tobytes()
+
+
+def test_raw_bytes_quantized():
+    data = np.array([-1.0, 0.0, 0.5, 1.0], dtype=np.float32)
+    raw = Tensor.serialize_quantized(data, bits=8).raw_bytes()
+
+    assert raw.readonly
+    assert raw.tobytes() == np.array([-127, 0, 64, 127], dtype=np.int8).tobytes()
+
+
+def test_pickle_raw_buffer_out_of_band():
+    data = np.arange(1024, dtype=np.float32)
+    serialized = Tensor.serialize(data, as_text=False)
+
+    buffers = []
+    payload = pickle.dumps(serialized, protocol=5, buffer_callback=buffers.append)
+    # The raw buffer is handed over as a frame instead of being copied into the payload.
+    assert len(buffers) == 1
+    assert len(payload) < len(serialized.buffer)
+
+    result = pickle.loads(payload, buffers=buffers)
+    assert result == serialized
+    assert np.array_equal(result.deserialize(), data)
+
+
+def test_pickle_text_buffer(example_tensor):
+    assert pickle.loads(pickle.dumps(example_tensor, protocol=5)) == example_tensor
+
+
+@pytest.mark.parametrize("bits, tolerance", [(8, 1 / 127), (16, 1 / 128)])
+def test_serialize_quantized(bits, tolerance):
+    rng = np.random.default_rng(42)
+    weights = rng.random((64,), dtype=np.float32)
+    weights /= weights.max()
+
+    serialized = Tensor.serialize_quantized(weights, bits=bits, as_text=False)
+    assert serialized.dtype == "float32"
+    assert len(serialized.buffer) < len(Tensor.serialize(weights, as_text=False).buffer)
+
+    result = serialized.deserialize()
+    assert result.dtype == np.float32
+    assert result.shape == weights.shape
+    assert np.allclose(result, weights, atol=tolerance)
+
+
+def test_serialize_quantized_invalid():
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([1, 2, 3]))
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([0.5]), bits=4)
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([1.0, np.inf]))
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([1.0, np.nan]), bits=16)
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([1.0, 1e300]))
+    with pytest.raises(ValueError):
+        Tensor.serialize_quantized(np.array([3.4e38], dtype=np.float32), bits=16)
+
+
+def test_serialize_quantized_subnormal():
+    weights = np.array([1e-44, -1e-45, 0.0], dtype=np.float32)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = Tensor.serialize_quantized(weights).deserialize()
+    assert np.allclose(result, weights, atol=1e-44)
+
+
+@pytest.mark.parametrize("bits", [8, 16])
+def test_serialize_quantized_transposed(bits):
+    weights = np.arange(12, dtype=np.float32).reshape(3, 4) / 11
+
+    result = Tensor.serialize_quantized(weights.T, bits=bits).deserialize()
+    assert result.shape == (4, 3)
+    assert np.allclose(result, weights.T, atol=1 / 64)
+
+
+def test_deserialize_casts_to_declared_dtype_torch(force_legacy_torch_compatible_api):
+    serialized = Tensor.serialize(torch.tensor([1, 2, 3], dtype=torch.int64))
+    tensor = Tensor(buffer=serialized.buffer, dtype="torch.float32", shape=[3])
+
+    result = tensor.deserialize()
+    assert result.dtype == torch.float32
+    assert result.tolist() == [1.0, 2.0, 3.0]